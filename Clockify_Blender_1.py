@@ -9,37 +9,154 @@ bl_info = {
 }
 
 import bpy
+import contextlib
+import functools
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
 import threading
 import time
 from datetime import datetime, timezone, timedelta
 from bpy.props import StringProperty, EnumProperty, BoolProperty, FloatProperty
 from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer orjson for decoding large API responses when it's available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # --- THREAD-SAFE GLOBAL VARIABLES ---
 api_queue = Queue()
 _data_lock = threading.RLock()  # Reentrant lock for nested access
 _timer_lock = threading.RLock()
 _operation_lock = threading.Lock()  # Prevents multiple operations
-_cached_projects_full = []  # Full project data cache
-
-# Protected by _data_lock
-_cached_projects = []
-_cached_clients = []
-_cached_client_id = None
+_session_lock = threading.Lock()
+_executor_lock = threading.Lock()
+_inflight_lock = threading.Lock()
+_current_timer_cache_lock = threading.Lock()
+
+# Immutable cache snapshot: (projects, projects_full, clients, client_id)
+# Replaced wholesale under _data_lock; read without locking. The lists are
+# stored as tuples so getters can hand them out without copying.
+_cache_snapshot = ((), (), (), None)
+_projects_by_client = {}  # client_id -> (project enum items, project IDs), rebuilt with projects_full
+_project_name_by_id = {}  # project_id -> name, rebuilt with projects
+_client_name_by_id = {}  # client_id -> name, rebuilt with clients
 
 # Protected by _timer_lock  
 _timer_start_time = None
 _last_session_duration = 0
 
 # Protected by _operation_lock
-_operation_in_progress = {"start": False, "stop": False, "status": False}
+_operation_in_progress = {
+    "start": False,
+    "stop": False,
+    "status": False,
+    "refresh_clients": False,
+    "refresh_projects": False
+}
+
+# Pre-compiled ISO 8601 duration pattern (PT1H30M45S)
+_ISO_DURATION_RE = re.compile(r'^PT(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?$')
+
+# Clockify paginates time entries (default page size is 50)
+_TIME_ENTRIES_PAGE_SIZE = 5000
+
+# (connect, read) seconds. Pool workers are joined at interpreter exit, so
+# together with the retry caps below this bounds how long a dead network can
+# hold up quitting Blender.
+_HTTP_TIMEOUT = (3.05, 10)
+
+# Protected by _session_lock
+_http_session = None
+_response_cache = {}  # url -> (etag, body digest, parsed data)
+
+# Protected by _executor_lock
+_api_executor = None
+
+# Protected by _inflight_lock
+_inflight_requests = {}  # request key -> callbacks waiting on the shared result
+
+# Recent current-timer answer: (monotonic timestamp, request key, timer data)
+# Replaced wholesale, so readers never see a partial update. Writes are
+# protected by _current_timer_cache_lock; the generation counts invalidations
+# so a GET sent before a start/stop can't re-cache its stale answer.
+_CURRENT_TIMER_CACHE_TTL = 3.0
+_current_timer_cache = None
+_current_timer_generation = 0
+
+# Main thread only: clients/projects are first fetched when the panel is first drawn
+_initial_fetch_done = False
+
+# Set by register() once the bpy.types.Scene properties exist, cleared by unregister()
+_scene_properties_registered = False
+
+# Main thread only: area types to redraw once the current queue pass finishes
+_pending_redraw_areas = set()
+_batch_depth = 0  # Nesting level of batched_scene_updates()
+
+# process_api_queue polling: fast while work arrives, doubling up to the max when idle
+_QUEUE_POLL_MIN = 0.01
+_QUEUE_POLL_MAX = 0.5
+_idle_ticks = 0
+
+# Deferred main-thread calls (zero-argument callables), drained by process_api_queue
+_main_thread_queue = Queue()
+
+# Snapshot-style responses where only the newest one in a queue batch matters
+_COALESCED_ACTIONS = frozenset({
+    'clients_fetched',
+    'projects_fetched',
+    'projects_fetched_full',
+    'bootstrap_done',
+    'current_timer',
+    'project_summary'
+})
+
+_display_ticker_on = False  # Main thread only: update_timer_display is registered
+_TICK_SLACK = 0.01  # Seconds past the boundary, so an early wake-up still lands on the new second
+
+# Main thread only: panel elapsed/billable lines for the current whole second
+_timer_text_key = None  # (whole second, hourly rate)
+_last_elapsed_str = ""
+_last_billable_str = ""
+
+# Main thread only: last applied current_timer / project_summary payload, used to skip unchanged polls
+_last_current_timer_state = None
+_last_project_summary_state = None
 
-# Flag to prevent double prompts
-_reset_prompt_shown = False
+# Text written to clockify_project_summary by handle_project_summary
+_PROJECT_SUMMARY_FMT = "This Month: {dur} ({n} sessions)\nBillable: ${amt:.2f} ({hr:.2f}h @ ${rate}/hr)"
+
+# Monotonic time of the last reset prompt, to debounce double prompts
+_RESET_PROMPT_DEBOUNCE = 5.0
+_last_reset_prompt_ts = 0.0
 
 # --- PREFERENCES ---
+# Display preferences read on every event/draw, copied into a plain dict
+_CACHED_PREFERENCE_NAMES = (
+    'hourly_rate',
+    'show_billable',
+    'show_elapsed_time',
+    'show_project_name',
+    'show_task_name',
+    'show_client_name',
+    'show_topbar_timer',
+    'show_last_session'
+)
+_prefs_cache = None
+
+def invalidate_preferences_cache(self=None, context=None):
+    """Property update callback: drop the cached preference values"""
+    global _prefs_cache
+    _prefs_cache = None
+
 class ClockifyPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
@@ -66,50 +183,58 @@ class ClockifyPreferences(bpy.types.AddonPreferences):
         name="Hourly Rate",
         description="Your hourly rate for billing calculations",
         default=25.0,
-        min=0.0
+        min=0.0,
+        update=invalidate_preferences_cache
     )
     
     # Display Options
     show_billable: BoolProperty(
         name="Show Billable Amount",
         description="Display billable amount in timer and summaries",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_elapsed_time: BoolProperty(
         name="Show Elapsed Time",
         description="Display elapsed time in active timer",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_project_name: BoolProperty(
         name="Show Project Name",
         description="Display project name in timer display",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_task_name: BoolProperty(
         name="Show Task Description",
         description="Display task description in active timer info",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_client_name: BoolProperty(
         name="Show Client Name",
         description="Display client name in active timer info",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_topbar_timer: BoolProperty(
         name="Show Timer in Top Bar",
         description="Display timer in the top right corner of Blender",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
     
     show_last_session: BoolProperty(
         name="Show Last Session Summary",
         description="Display last session summary after stopping timer",
-        default=True
+        default=True,
+        update=invalidate_preferences_cache
     )
 
     def draw(self, context):
@@ -145,24 +270,100 @@ def get_preferences():
     """Get addon preferences"""
     return bpy.context.preferences.addons[__name__].preferences
 
-def get_api_headers():
-    """Get API headers with current API key"""
+def get_preferences_cached():
+    """Get the display preferences as a dict, re-read only after a preference changes"""
+    global _prefs_cache
+    if _prefs_cache is None:
+        prefs = get_preferences()
+        _prefs_cache = {name: getattr(prefs, name) for name in _CACHED_PREFERENCE_NAMES}
+    return _prefs_cache
+
+def get_api_config():
+    """Snapshot API credentials as plain values - call on the main thread"""
     prefs = get_preferences()
+    set_session_api_key(prefs.api_key)
     return {
-        "X-Api-Key": prefs.api_key,
-        "Content-Type": "application/json"
+        'workspace_id': prefs.workspace_id,
+        'user_id': prefs.user_id
     }
 
+def get_http_session():
+    """Get the shared keep-alive HTTP session, creating it on first use"""
+    global _http_session
+    with _session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # One connect retry and none on read timeouts, which already waited the full read timeout
+            retries = Retry(total=2, connect=1, read=0, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+            session.headers.update({"Content-Type": "application/json"})
+            _http_session = session
+        return _http_session
+
+def set_session_api_key(api_key):
+    """Update the session's API key header, only when the key has changed"""
+    session = get_http_session()
+    if session.headers.get("X-Api-Key") != api_key:
+        with _session_lock:
+            session.headers["X-Api-Key"] = api_key
+
+def close_http_session():
+    """Close the shared HTTP session and its pooled connections"""
+    global _http_session
+    with _session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+        _response_cache.clear()
+
+def get_api_executor():
+    """Get the shared API worker pool, creating it on first use"""
+    global _api_executor
+    with _executor_lock:
+        if _api_executor is None:
+            _api_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clockify")
+        return _api_executor
+
+def shutdown_api_executor():
+    """Shut down the shared API worker pool, dropping queued requests without waiting"""
+    global _api_executor
+    with _executor_lock:
+        if _api_executor is not None:
+            _api_executor.shutdown(wait=False, cancel_futures=True)
+            _api_executor = None
+
 # --- UTILITY FUNCTIONS ---
-def calculate_billing_info(duration_seconds):
+def assign_if_changed(owner, prop_name, value):
+    """Assign an RNA property only when it differs; returns True if it was written"""
+    if getattr(owner, prop_name) != value:
+        setattr(owner, prop_name, value)
+        return True
+    return False
+
+# Scene properties describing the running timer, cleared together when it ends
+_ACTIVE_TIMER_PROPERTIES = (
+    'clockify_active_timer_id',
+    'clockify_active_timer_desc',
+    'clockify_active_project',
+    'clockify_active_project_name',
+    'clockify_active_client_name'
+)
+
+def clear_active_timer_properties(scene):
+    """Blank the active timer properties, writing only those still set"""
+    for prop_name in _ACTIVE_TIMER_PROPERTIES:
+        assign_if_changed(scene, prop_name, "")
+
+def calculate_billing_info(duration_seconds, hourly_rate=None):
     """Calculate billing information for a time duration"""
-    prefs = get_preferences()
+    if hourly_rate is None:
+        hourly_rate = get_preferences_cached()['hourly_rate']
     hours = duration_seconds / 3600.0
-    billable_amount = hours * prefs.hourly_rate
+    billable_amount = hours * hourly_rate
     return {
         'hours': hours,
         'billable_amount': billable_amount,
-        'rate': prefs.hourly_rate
+        'rate': hourly_rate
     }
 
 def format_duration_detailed(seconds):
@@ -186,56 +387,35 @@ def format_duration_detailed(seconds):
 
 def parse_iso_duration(duration_str):
     """Parse ISO 8601 duration (PT1H30M45S) to seconds"""
-    if not duration_str or duration_str == "PT0S":
+    if not duration_str:
         return 0
     
-    # Remove PT prefix
-    duration_str = duration_str.replace('PT', '')
-    
-    hours = 0
-    minutes = 0
-    seconds = 0
-    
-    # Parse hours
-    if 'H' in duration_str:
-        hours_part = duration_str.split('H')[0]
-        hours = float(hours_part)
-        duration_str = duration_str.split('H')[1]
-    
-    # Parse minutes
-    if 'M' in duration_str:
-        minutes_part = duration_str.split('M')[0]
-        minutes = float(minutes_part)
-        duration_str = duration_str.split('M')[1]
-    
-    # Parse seconds
-    if 'S' in duration_str:
-        seconds_part = duration_str.split('S')[0]
-        seconds = float(seconds_part)
+    match = _ISO_DURATION_RE.match(duration_str)
+    if not match:
+        return 0
     
-    return int(hours * 3600 + minutes * 60 + seconds)
+    hours, minutes, seconds = match.groups()
+    return int(float(hours or 0) * 3600 + float(minutes or 0) * 60 + float(seconds or 0))
+
+_NO_CLIENT_PROJECTS = ((), frozenset())
+
+def _get_client_projects_entry(client_id):
+    """Get the (enum items, project ID set) index entry for a client selection"""
+    if not client_id or client_id == "CREATE_NEW":
+        # Don't show any projects when creating new client
+        return _NO_CLIENT_PROJECTS
+    if client_id == "NONE":
+        # Show projects with no client assigned
+        client_id = None
+    return _projects_by_client.get(client_id, _NO_CLIENT_PROJECTS)
 
 def get_filtered_projects_for_client(client_id):
     """Get projects filtered by client ID"""
-    projects = []
-    cached_projects_full = get_cached_projects_full()
-    
-    for p in cached_projects_full:
-        project_id, project_name, project_desc, proj_client_id = p
-        
-        if client_id == "NONE":
-            # Show projects with no client assigned
-            if not proj_client_id:
-                projects.append((project_id, project_name, project_desc))
-        elif client_id == "CREATE_NEW":
-            # Don't show any projects when creating new client
-            continue
-        elif client_id and client_id != "NONE":
-            # Show projects that belong to the selected client
-            if proj_client_id == client_id:
-                projects.append((project_id, project_name, project_desc))
-    
-    return projects
+    return _get_client_projects_entry(client_id)[0]
+
+def is_project_for_client(project_id, client_id):
+    """Check whether a project is listed under the given client selection"""
+    return project_id in _get_client_projects_entry(client_id)[1]
 
 # --- FILE PERSISTENCE ---
 def save_task_description_to_file():
@@ -250,7 +430,10 @@ def save_task_description_to_file():
         print(f"Error saving task description: {e}")
 
 def load_task_description_from_file():
-    """Load task description from blend file custom properties"""
+    """Load task description from blend file custom properties.
+    
+    Always returns None so it can be registered directly as a one-shot timer.
+    """
     try:
         scene = bpy.context.scene
         if "clockify_saved_task" in scene:
@@ -258,55 +441,83 @@ def load_task_description_from_file():
             if hasattr(scene, 'clockify_task_description'):
                 scene.clockify_task_description = saved_task
                 print(f"Loaded task description: {saved_task}")
-                return saved_task
     except Exception as e:
         print(f"Error loading task description: {e}")
     return None
 
 # --- THREAD-SAFE ACCESSORS ---
-def get_cached_projects():
-    """Thread-safe getter for cached projects"""
+def _replace_cache_snapshot(index, value):
+    """Swap in a new cache snapshot with one field replaced"""
+    global _cache_snapshot
     with _data_lock:
-        return _cached_projects.copy()
+        snapshot = list(_cache_snapshot)
+        snapshot[index] = value
+        _cache_snapshot = tuple(snapshot)
+
+def get_cached_projects():
+    """Lock-free getter for cached projects"""
+    return _cache_snapshot[0]
 
 def set_cached_projects(projects):
     """Thread-safe setter for cached projects"""
+    global _project_name_by_id
     with _data_lock:
-        global _cached_projects
-        _cached_projects = projects
+        _replace_cache_snapshot(0, tuple(projects))
+        _project_name_by_id = {p[0]: p[1] for p in projects}
+
+def get_project_name_by_id(project_id, default="Unknown Project"):
+    """Lock-free project name lookup by ID"""
+    return _project_name_by_id.get(project_id, default)
+
+def is_cached_project_id(project_id):
+    """Check whether a project ID is in the cache"""
+    return project_id in _project_name_by_id
 
 def get_cached_projects_full():
-    """Thread-safe getter for cached projects with full data"""
-    with _data_lock:
-        return _cached_projects_full.copy()
+    """Lock-free getter for cached projects with full data"""
+    return _cache_snapshot[1]
 
 def set_cached_projects_full(projects):
     """Thread-safe setter for cached projects with full data"""
+    global _projects_by_client
+    
+    # Index enum items by client ID (None for projects without a client)
+    by_client = {}
+    for project_id, project_name, project_desc, client_id in projects:
+        by_client.setdefault(client_id or None, []).append((project_id, project_name, project_desc))
+    
     with _data_lock:
-        global _cached_projects_full
-        _cached_projects_full = projects
+        _replace_cache_snapshot(1, tuple(projects))
+        _projects_by_client = {
+            k: (tuple(v), frozenset(item[0] for item in v)) for k, v in by_client.items()
+        }
 
 def get_cached_clients():
-    """Thread-safe getter for cached clients"""
-    with _data_lock:
-        return _cached_clients.copy()
+    """Lock-free getter for cached clients"""
+    return _cache_snapshot[2]
 
 def set_cached_clients(clients):
     """Thread-safe setter for cached clients"""
+    global _client_name_by_id
     with _data_lock:
-        global _cached_clients
-        _cached_clients = clients
+        _replace_cache_snapshot(2, tuple(clients))
+        _client_name_by_id = {c[0]: c[1] for c in clients}
+
+def get_client_name_by_id(client_id, default=""):
+    """Lock-free client name lookup by ID"""
+    return _client_name_by_id.get(client_id, default)
+
+def is_cached_client_id(client_id):
+    """Check whether a client ID is in the cache"""
+    return client_id in _client_name_by_id
 
 def get_cached_client_id():
-    """Thread-safe getter for cached client ID"""
-    with _data_lock:
-        return _cached_client_id
+    """Lock-free getter for cached client ID"""
+    return _cache_snapshot[3]
 
 def set_cached_client_id(client_id):
     """Thread-safe setter for cached client ID"""
-    with _data_lock:
-        global _cached_client_id
-        _cached_client_id = client_id
+    _replace_cache_snapshot(3, client_id)
 
 def get_timer_start_time():
     """Thread-safe getter for timer start time"""
@@ -335,6 +546,10 @@ def is_operation_in_progress(operation_type):
     with _operation_lock:
         return _operation_in_progress.get(operation_type, False)
 
+def snapshot_operations():
+    """Copy of all operation progress flags for draw code; dict.copy is atomic under the GIL"""
+    return _operation_in_progress.copy()
+
 def set_operation_in_progress(operation_type, value):
     """Set operation progress state"""
     with _operation_lock:
@@ -354,64 +569,67 @@ def safe_context_access(func):
     return wrapper
 
 # --- DYNAMIC ENUM ITEMS ---
+# Enum callbacks run on every redraw, so their lists are rebuilt only when the
+# immutable cache snapshot they came from is replaced. Holding the lists here
+# also keeps the item strings alive, which Blender requires for dynamic enums.
+_client_items_cache = (None, [])  # (source clients tuple, enum items)
+_project_items_cache = {}  # client id -> (source projects tuple, enum items)
+
 def get_client_items(self, context):
     """Dynamic client items for EnumProperty"""
+    global _client_items_cache
+    cached_clients = get_cached_clients()
+    source, items = _client_items_cache
+    if source is cached_clients:
+        return items
+    
     items = []
     
     # Add "None" option for projects without clients
     items.append(("NONE", "None (No Client)", "Show projects without assigned clients"))
     
     # Add cached Clockify clients
-    cached_clients = get_cached_clients()
-    if cached_clients:
-        for c in cached_clients:
-            items.append((c[0], c[1], c[2]))
+    for c in cached_clients:
+        items.append((c[0], c[1], c[2]))
     
     # Add create new option
     items.append(("CREATE_NEW", "➕ Create New Client...", "Create a new client"))
     
+    _client_items_cache = (cached_clients, items)
     return items
 
 def get_project_items(self, context):
     """Dynamic project items for EnumProperty - filtered by selected client"""
-    items = []
     scene = context.scene
     
     # Get selected client
     selected_client = getattr(scene, 'clockify_client', None)
     
     # Add cached Clockify projects filtered by client
-    cached_projects_full = get_cached_projects_full()
-    if cached_projects_full:
-        for p in cached_projects_full:
-            project_id, project_name, project_desc, client_id = p
-            
-            # Filter based on selected client
-            if selected_client == "NONE":
-                # Show projects with no client assigned
-                if not client_id:
-                    items.append((project_id, project_name, project_desc))
-            elif selected_client == "CREATE_NEW":
-                # Don't show any projects when creating new client
-                continue
-            elif selected_client and selected_client != "NONE":
-                # Show projects that belong to the selected client
-                if client_id == selected_client:
-                    items.append((project_id, project_name, project_desc))
+    filtered_projects = get_filtered_projects_for_client(selected_client)
+    cached = _project_items_cache.get(selected_client)
+    if cached is not None and cached[0] is filtered_projects:
+        return cached[1]
+    
+    items = list(filtered_projects)
     
     # Add create new option
     items.append(("CREATE_NEW", "➕ Create New Project...", "Create a new project"))
     
-    return items if items else [("CREATE_NEW", "➕ Create New Project...", "Create a new project")]
+    _project_items_cache[selected_client] = (filtered_projects, items)
+    return items
 
 # --- TIMER DISPLAY FUNCTIONS ---
 def format_timer_display(seconds):
     """Format seconds into HH:MM:SS format"""
-    if seconds < 0:
-        seconds = 0
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    # Whole seconds only, so redraws within the same second share a cache entry
+    return _format_timer_seconds(max(0, int(seconds)))
+
+@functools.lru_cache(maxsize=8)
+def _format_timer_seconds(seconds):
+    """Cached HH:MM:SS formatting for a non-negative whole number of seconds"""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 def get_current_timer_duration():
@@ -421,39 +639,61 @@ def get_current_timer_duration():
         return 0
     return max(0, time.time() - start_time)
 
+def refresh_timer_text(current_second=None):
+    """Return the panel's (elapsed, billable) lines, rebuilt only when the second or rate changes"""
+    global _timer_text_key, _last_elapsed_str, _last_billable_str
+    if current_second is None:
+        current_second = int(get_current_timer_duration())
+    hourly_rate = get_preferences_cached()['hourly_rate']
+    key = (current_second, hourly_rate)
+    if key != _timer_text_key:
+        billing = calculate_billing_info(current_second, hourly_rate)
+        _last_elapsed_str = f"Elapsed: {format_duration_detailed(current_second)}"
+        if billing['hours'] > 0:
+            _last_billable_str = f"Billable: ${billing['billable_amount']:.2f} @ ${hourly_rate}/hr"
+        else:
+            _last_billable_str = ""
+        _timer_text_key = key
+    return _last_elapsed_str, _last_billable_str
+
 @safe_context_access
 def draw_clockify_timer(self, context):
     """Draw the Clockify timer in the top bar"""
-    layout = self.layout
-    region = context.region
-    scene = context.scene
-    prefs = get_preferences()
+    # Only show on the right side of the top bar
+    if context.region.alignment != 'RIGHT':
+        return
     
-    # Only show on the right side of the top bar and if enabled in preferences
-    if region.alignment == 'RIGHT' and prefs.show_topbar_timer:
-        # Check if there's an active timer
-        if hasattr(scene, 'clockify_active_timer_id') and scene.clockify_active_timer_id:
-            # Calculate elapsed time
-            current_duration = get_current_timer_duration()
-            time_display = format_timer_display(current_duration)
-            
-            # Create a row for the timer display
-            row = layout.row(align=True)
-            row.alert = True  # This makes the text red/highlighted
-            row.label(text=f"⏱ {time_display}", icon='TIME')
-            
-            # Show billing info if enabled
-            if prefs.show_billable:
-                billing = calculate_billing_info(current_duration)
-                if billing['hours'] > 0:
-                    row.label(text=f"${billing['billable_amount']:.2f}")
-            
-            # Show project name if enabled
-            if prefs.show_project_name and hasattr(scene, 'clockify_active_project_name') and scene.clockify_active_project_name:
-                project_name = scene.clockify_active_project_name
-                if len(project_name) > 15:
-                    project_name = project_name[:12] + "..."
-                row.label(text=f"({project_name})")
+    # Check if there's an active timer
+    scene = context.scene
+    if not getattr(scene, 'clockify_active_timer_id', ''):
+        return
+    
+    prefs = get_preferences_cached()
+    if not prefs['show_topbar_timer']:
+        return
+    
+    # Calculate elapsed time
+    current_duration = get_current_timer_duration()
+    time_display = format_timer_display(current_duration)
+    
+    # Create a row for the timer display
+    row = self.layout.row(align=True)
+    row.alert = True  # This makes the text red/highlighted
+    row.label(text=f"⏱ {time_display}", icon='TIME')
+    
+    # Show billing info if enabled
+    if prefs['show_billable']:
+        billing = calculate_billing_info(current_duration, prefs['hourly_rate'])
+        if billing['hours'] > 0:
+            row.label(text=f"${billing['billable_amount']:.2f}")
+    
+    # Show project name if enabled
+    if prefs['show_project_name']:
+        project_name = getattr(scene, 'clockify_active_project_name', '')
+        if project_name:
+            if len(project_name) > 15:
+                project_name = project_name[:12] + "..."
+            row.label(text=f"({project_name})")
 
 @safe_context_access
 def update_timer_display():
@@ -467,144 +707,278 @@ def update_timer_display():
         if not scene:
             return 1.0
             
-        # Continue updating only if there's an active timer
-        if hasattr(scene, 'clockify_active_timer_id') and scene.clockify_active_timer_id:
-            # Force redraw of all relevant areas
-            try:
-                if bpy.context.screen:
-                    for area in bpy.context.screen.areas:
-                        if area.type in ['TOPBAR', 'VIEW_3D']:
-                            area.tag_redraw()
-                            
-                # Also force window manager update
-                for window in bpy.context.window_manager.windows:
-                    for area in window.screen.areas:
-                        if area.type in ['TOPBAR', 'VIEW_3D']:
-                            area.tag_redraw()
-                            
-            except Exception as e:
-                print(f"Error in redraw: {e}")
+        # Continue updating only while a timer is actually counting: an active ID
+        # without a known start time (e.g. restored from a file) has nothing to tick
+        if (hasattr(scene, 'clockify_active_timer_id') and scene.clockify_active_timer_id
+                and get_timer_start_time() is not None):
+            elapsed = get_current_timer_duration()
+            refresh_timer_text(int(elapsed))
+            
+            # Redraw the top bar clock and the sidebar panel only
+            tag_redraw_types()
             
-            return 1.0  # Update every second
+            # Wake just after the next whole second so the clock doesn't drift or skip
+            return 1.0 - (elapsed % 1.0) + _TICK_SLACK
         else:
-            return None  # Stop the timer
+            return _stop_display_ticker_from_tick()  # Stop the timer
     except Exception as e:
         print(f"Error updating timer display: {e}")
-        return None
+        return _stop_display_ticker_from_tick()
+
+def _stop_display_ticker_from_tick():
+    """Clear the ticker flag when update_timer_display ends itself by returning None"""
+    global _display_ticker_on
+    _display_ticker_on = False
+    return None
+
+def _start_display_ticker():
+    """Start the 1 Hz elapsed-time display unless it is already running"""
+    global _display_ticker_on
+    # Loading a .blend drops non-persistent timers without clearing the flag,
+    # so confirm a set flag before trusting it
+    if _display_ticker_on and bpy.app.timers.is_registered(update_timer_display):
+        return
+    _display_ticker_on = True
+    first_interval = 1.0 - (get_current_timer_duration() % 1.0) + _TICK_SLACK
+    bpy.app.timers.register(update_timer_display, first_interval=first_interval)
+
+def _stop_display_ticker():
+    """Stop the elapsed-time display so nothing wakes up while no timer runs"""
+    global _display_ticker_on
+    if _display_ticker_on:
+        _display_ticker_on = False
+        try:
+            bpy.app.timers.unregister(update_timer_display)
+        except ValueError:
+            pass  # Already stopped itself
 
 # --- TIMER RESET FUNCTIONS ---
 def reset_blender_timer():
     """Reset the Blender timer to 0 state"""
-    global _reset_prompt_shown
-    _reset_prompt_shown = False
+    global _last_reset_prompt_ts
+    _last_reset_prompt_ts = 0.0
     
     set_timer_start_time(None)
     set_last_session_duration(0)
+    _stop_display_ticker()
     
     scene = bpy.context.scene
-    scene.clockify_active_timer_id = ""
-    scene.clockify_active_timer_desc = ""
-    scene.clockify_active_project = ""
-    scene.clockify_active_project_name = ""
-    scene.clockify_active_client_name = ""
+    clear_active_timer_properties(scene)
     scene.clockify_status = "Timer reset - ready to start a new session"
     
     # Force UI redraw
-    if bpy.context.screen:
-        for area in bpy.context.screen.areas:
-            if area.type in ['TOPBAR', 'VIEW_3D']:
-                area.tag_redraw()
+    request_redraw('TOPBAR', 'VIEW_3D')
 
 # --- API UTILS ---
-def fetch_clients_async(callback=None):
-    """Fetch all clients in a separate thread"""
-    def _fetch():
+def post_api_result(action, data, callback=None):
+    """Hand a worker result to the main thread via the API queue"""
+    # bpy (including bpy.app.timers) must not be touched from worker threads,
+    # so results always go through the queue drained by process_api_queue
+    api_queue.put((action, data, callback))
+
+def submit_api_task(fn, *args):
+    """Run fn on the API worker pool; main thread only.
+    
+    Workers cannot touch bpy.app.timers, so the wake-up happens here: the
+    queue processor drops back to its fastest poll until the answer arrives.
+    """
+    future = get_api_executor().submit(fn, *args)
+    wake_api_queue_processor()
+    return future
+
+def invalidate_current_timer_cache():
+    """Drop the cached current-timer answer after the timer state changed"""
+    global _current_timer_cache, _current_timer_generation
+    with _current_timer_cache_lock:
+        _current_timer_generation += 1
+        _current_timer_cache = None
+
+def inflight_key(request_key, join=True):
+    """Return the in-flight key for a request; join=False gives a private key nothing shares"""
+    return request_key if join else request_key + (object(),)
+
+def join_inflight_request(request_key, callback):
+    """Wait on an identical in-flight request; returns True if the caller should send it"""
+    with _inflight_lock:
+        waiters = _inflight_requests.get(request_key)
+        if waiters is not None:
+            waiters.append(callback)
+            return False
+        _inflight_requests[request_key] = [callback]
+        return True
+
+def finish_inflight_request(request_key, action, data):
+    """Post a shared result once, fanning it out to every caller that joined"""
+    with _inflight_lock:
+        waiters = _inflight_requests.pop(request_key, [])
+    
+    callbacks = [cb for cb in waiters if cb]
+    if len(callbacks) > 1:
+        post_api_result(action, data, functools.partial(run_callbacks, callbacks))
+    else:
+        post_api_result(action, data, callbacks[0] if callbacks else None)
+
+def run_callbacks(callbacks, action, data):
+    """Invoke each coalesced callback, isolating failures"""
+    for callback in callbacks:
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/clients"
-            res = requests.get(url, headers=headers, timeout=10)
-            
-            if res.status_code == 200:
-                clients_data = res.json()
-                clients = [(c['id'], c['name'], c['name']) for c in clients_data]
-                api_queue.put(('clients_fetched', clients, callback))
-            else:
-                api_queue.put(('error', f"Failed to fetch clients: {res.status_code}", callback))
+            callback(action, data)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            print(f"Error in callback: {e}")
+
+def parse_clients(clients_data):
+    """Shape raw client JSON into enum-style tuples"""
+    return [(c['id'], c['name'], c['name']) for c in clients_data]
+
+def parse_projects(projects_data):
+    """Shape raw project JSON into full (with client ID) and simple tuples"""
+    # Store full project data including client info
+    projects_full = []
+    projects_simple = []
+    
+    for p in projects_data:
+        project_id = p['id']
+        project_name = p['name']
+        client_id = p.get('clientId', None)  # May be None for projects without clients
+        
+        # Store full data for filtering
+        projects_full.append((project_id, project_name, project_name, client_id))
+        # Store simple data for backward compatibility
+        projects_simple.append((project_id, project_name, project_name))
+    
+    return {'full': projects_full, 'simple': projects_simple}
+
+def get_json_cached(url, parse):
+    """GET a JSON resource, reusing the last parsed result when it hasn't changed
+    
+    Sends If-None-Match when the server gave an ETag; otherwise compares a hash
+    of the body. Returns (status_code, parsed_data or None).
+    """
+    with _session_lock:
+        cached = _response_cache.get(url)
+    
+    headers = {}
+    if cached and cached[0]:
+        headers["If-None-Match"] = cached[0]
+    res = get_http_session().get(url, headers=headers, timeout=_HTTP_TIMEOUT)
+    
+    if res.status_code == 304 and cached:
+        return 200, cached[2]
+    if res.status_code != 200:
+        return res.status_code, None
+    
+    digest = hashlib.blake2b(res.content, digest_size=8).digest()
+    if cached and cached[1] == digest:
+        return 200, cached[2]
+    
+    parsed = parse(_json_loads(res.content))
+    with _session_lock:
+        _response_cache[url] = (res.headers.get("ETag"), digest, parsed)
+    return 200, parsed
+
+def request_clients(workspace_id):
+    """Request the client list, returning an (action, data) pair for the API queue"""
+    url = f"https://api.clockify.me/api/v1/workspaces/{workspace_id}/clients"
+    status_code, clients = get_json_cached(url, parse_clients)
+    
+    if status_code == 200:
+        return 'clients_fetched', clients
+    return 'error', f"Failed to fetch clients: {status_code}"
+
+def request_projects(workspace_id):
+    """Request the project list with client information, returning an (action, data) pair"""
+    url = f"https://api.clockify.me/api/v1/workspaces/{workspace_id}/projects"
+    status_code, projects = get_json_cached(url, parse_projects)
+    
+    if status_code == 200:
+        return 'projects_fetched_full', projects
+    return 'error', f"Failed to fetch projects: {status_code}"
+
+def fetch_clients_async(callback=None, join=True):
+    """Fetch all clients on a pooled worker thread
+    
+    Pass join=False after a write: a GET already in flight may predate it.
+    """
+    def _fetch(config, request_key):
+        try:
+            action, data = request_clients(config['workspace_id'])
+        except Exception as e:
+            action, data = 'error', f"Network error: {str(e)}"
+        finish_inflight_request(request_key, action, data)
     
-    thread = threading.Thread(target=_fetch, daemon=True)
-    thread.start()
+    config = get_api_config()
+    request_key = inflight_key(('clients', config['workspace_id']), join)
+    if join_inflight_request(request_key, callback):
+        submit_api_task(_fetch, config, request_key)
 
 def create_client_async(name, callback=None):
-    """Create client in a separate thread"""
-    def _create():
+    """Create client on a pooled worker thread"""
+    def _create(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/clients"
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/clients"
             payload = {
                 "name": name,
                 "address": "",
                 "note": "Auto-created by Blender Clockify plugin"
             }
-            res = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
+            res = get_http_session().post(url, data=json.dumps(payload), timeout=_HTTP_TIMEOUT)
             
             if res.status_code == 201:
-                client_data = res.json()
-                api_queue.put(('client_created_new', client_data, callback))
+                client_data = _json_loads(res.content)
+                post_api_result('client_created_new', client_data, callback)
             else:
-                api_queue.put(('error', f"Failed to create client: {res.status_code} - {res.text}", callback))
+                post_api_result('error', f"Failed to create client: {res.status_code} - {res.text}", callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_create, daemon=True)
-    thread.start()
+    submit_api_task(_create, get_api_config())
 
-def fetch_projects_async(callback=None):
-    """Fetch projects in a separate thread with client information"""
-    def _fetch():
+def fetch_projects_async(callback=None, join=True):
+    """Fetch projects on a pooled worker thread with client information
+    
+    Pass join=False after a write: a GET already in flight may predate it.
+    """
+    def _fetch(config, request_key):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/projects"
-            res = requests.get(url, headers=headers, timeout=10)
-            if res.status_code == 200:
-                projects_data = res.json()
-                # Store full project data including client info
-                projects_full = []
-                projects_simple = []
-                
-                for p in projects_data:
-                    project_id = p['id']
-                    project_name = p['name']
-                    client_id = p.get('clientId', None)  # May be None for projects without clients
-                    
-                    # Store full data for filtering
-                    projects_full.append((project_id, project_name, project_name, client_id))
-                    # Store simple data for backward compatibility
-                    projects_simple.append((project_id, project_name, project_name))
-                
-                api_queue.put(('projects_fetched_full', {'full': projects_full, 'simple': projects_simple}, callback))
+            action, data = request_projects(config['workspace_id'])
+        except Exception as e:
+            action, data = 'error', f"Network error: {str(e)}"
+        finish_inflight_request(request_key, action, data)
+    
+    config = get_api_config()
+    request_key = inflight_key(('projects', config['workspace_id']), join)
+    if join_inflight_request(request_key, callback):
+        submit_api_task(_fetch, config, request_key)
+
+def fetch_bootstrap_async(callback=None):
+    """Fetch clients and projects concurrently and report them as one result"""
+    def _fetch(config):
+        try:
+            # Projects run on a second pooled worker while this one fetches clients
+            projects_future = get_api_executor().submit(request_projects, config['workspace_id'])
+            clients_action, clients = request_clients(config['workspace_id'])
+            projects_action, projects = projects_future.result()
+            
+            if clients_action == 'error':
+                post_api_result(clients_action, clients, callback)
+            elif projects_action == 'error':
+                post_api_result(projects_action, projects, callback)
             else:
-                api_queue.put(('error', f"Failed to fetch projects: {res.status_code}", callback))
+                bootstrap_data = {
+                    'clients': clients,
+                    'projects_full': projects['full'],
+                    'projects_simple': projects['simple']
+                }
+                post_api_result('bootstrap_done', bootstrap_data, callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_fetch, daemon=True)
-    thread.start()
+    submit_api_task(_fetch, get_api_config())
 
 def get_project_summary_async(project_id, callback=None):
     """Get project time summary for the current month"""
-    def _fetch():
+    def _fetch(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
             # Calculate current month start and end
             today = datetime.now(timezone.utc)
             month_start = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -616,83 +990,88 @@ def get_project_summary_async(project_id, callback=None):
                 month_end = month_start.replace(month=month_start.month + 1)
             
             # Get time entries for this project this month
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/user/{prefs.user_id}/time-entries"
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/user/{config['user_id']}/time-entries"
             params = {
                 "start": month_start.isoformat(),
                 "end": month_end.isoformat(),
-                "project": project_id
+                "project": project_id,
+                "page-size": _TIME_ENTRIES_PAGE_SIZE
             }
             
-            res = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if res.status_code == 200:
-                time_entries = res.json()
+            # Walk all pages, summing durations as each page arrives
+            _parse = parse_iso_duration
+            total_seconds = 0
+            entries_count = 0
+            page = 1
+            while True:
+                params["page"] = page
+                res = get_http_session().get(url, params=params, timeout=_HTTP_TIMEOUT)
                 
-                # Calculate total duration
-                total_seconds = 0
-                for entry in time_entries:
-                    if entry.get('timeInterval', {}).get('duration'):
-                        duration_str = entry['timeInterval']['duration']
-                        total_seconds += parse_iso_duration(duration_str)
+                if res.status_code != 200:
+                    post_api_result('error', f"Failed to fetch project summary: {res.status_code}", callback)
+                    return
                 
-                summary_data = {
-                    'total_seconds': total_seconds,
-                    'entries_count': len(time_entries),
-                    'month_start': month_start,
-                    'month_end': month_end
-                }
+                time_entries = _json_loads(res.content)
+                for entry in time_entries:
+                    time_interval = entry.get('timeInterval')
+                    duration_str = time_interval and time_interval.get('duration')
+                    if duration_str:
+                        total_seconds += _parse(duration_str)
+                entries_count += len(time_entries)
                 
-                api_queue.put(('project_summary', summary_data, callback))
-            else:
-                api_queue.put(('error', f"Failed to fetch project summary: {res.status_code}", callback))
+                if len(time_entries) < _TIME_ENTRIES_PAGE_SIZE:
+                    break
+                page += 1
+            
+            summary_data = {
+                'total_seconds': total_seconds,
+                'entries_count': entries_count,
+                'month_start': month_start,
+                'month_end': month_end
+            }
+            
+            post_api_result('project_summary', summary_data, callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_fetch, daemon=True)
-    thread.start()
+    submit_api_task(_fetch, get_api_config())
 
 def start_timer_async(description, project_id, callback=None):
-    """Start timer in a separate thread"""
-    def _start():
+    """Start timer on a pooled worker thread"""
+    def _start(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/time-entries"
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/time-entries"
             payload = {
                 "start": None,  # Auto-start time
                 "description": description,
                 "projectId": project_id
             }
-            res = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
+            res = get_http_session().post(url, data=json.dumps(payload), timeout=_HTTP_TIMEOUT)
             if res.status_code == 201:
-                timer_data = res.json()
-                api_queue.put(('timer_started', timer_data, callback))
+                timer_data = _json_loads(res.content)
+                invalidate_current_timer_cache()
+                post_api_result('timer_started', timer_data, callback)
             else:
-                api_queue.put(('error', f"Failed to start timer: {res.status_code} - {res.text}", callback))
+                post_api_result('error', f"Failed to start timer: {res.status_code} - {res.text}", callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_start, daemon=True)
-    thread.start()
+    submit_api_task(_start, get_api_config())
 
 def stop_timer_async(callback=None):
-    """Stop timer in a separate thread"""
-    def _stop():
+    """Stop timer on a pooled worker thread"""
+    def _stop(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/user/{prefs.user_id}/time-entries?in-progress=true"
-            res = requests.get(url, headers=headers, timeout=10)
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/user/{config['user_id']}/time-entries?in-progress=true"
+            res = get_http_session().get(url, timeout=_HTTP_TIMEOUT)
             
             if res.status_code != 200:
-                api_queue.put(('error', f"Failed to get current timer: {res.status_code}", callback))
+                post_api_result('error', f"Failed to get current timer: {res.status_code}", callback)
                 return
             
-            timer_list = res.json()
+            timer_list = _json_loads(res.content)
             if not timer_list:
-                api_queue.put(('no_active_timer', None, callback))
+                post_api_result('no_active_timer', None, callback)
                 return
             
             current_timer = timer_list[0]
@@ -704,7 +1083,7 @@ def stop_timer_async(callback=None):
                 duration = time.time() - start_time
                 set_last_session_duration(duration)
             
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/time-entries/{timer_id}"
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/time-entries/{timer_id}"
             current_time = datetime.now(timezone.utc).isoformat()
             
             payload = {
@@ -717,90 +1096,99 @@ def stop_timer_async(callback=None):
                 "tagIds": current_timer.get('tagIds', [])
             }
             
-            res = requests.put(url, headers=headers, data=json.dumps(payload), timeout=10)
+            res = get_http_session().put(url, data=json.dumps(payload), timeout=_HTTP_TIMEOUT)
             
             if res.status_code == 200:
+                invalidate_current_timer_cache()
                 # Pass the current timer data so we can extract session info
-                api_queue.put(('timer_stopped', current_timer, callback))
+                post_api_result('timer_stopped', current_timer, callback)
             else:
-                api_queue.put(('error', f"Failed to stop timer: {res.status_code} - {res.text}", callback))
+                post_api_result('error', f"Failed to stop timer: {res.status_code} - {res.text}", callback)
                 
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_stop, daemon=True)
-    thread.start()
+    submit_api_task(_stop, get_api_config())
 
 def create_project_async(name, callback=None):
-    """Create project in a separate thread"""
-    def _create():
+    """Create project on a pooled worker thread"""
+    def _create(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
             client_id = get_cached_client_id()
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/projects"
+            url = f"https://api.clockify.me/api/v1/workspaces/{config['workspace_id']}/projects"
             payload = {
                 "name": name,
                 "clientId": client_id,
                 "isPublic": False,
                 "color": "#3498db"
             }
-            res = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
+            res = get_http_session().post(url, data=json.dumps(payload), timeout=_HTTP_TIMEOUT)
             
             if res.status_code == 201:
-                project_data = res.json()
-                api_queue.put(('project_created', project_data, callback))
+                project_data = _json_loads(res.content)
+                post_api_result('project_created', project_data, callback)
             else:
-                api_queue.put(('error', f"Failed to create project: {res.status_code} - {res.text}", callback))
+                post_api_result('error', f"Failed to create project: {res.status_code} - {res.text}", callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            post_api_result('error', f"Network error: {str(e)}", callback)
     
-    thread = threading.Thread(target=_create, daemon=True)
-    thread.start()
+    submit_api_task(_create, get_api_config())
 
 def get_user_info_async(callback=None):
     """Get user info from API to auto-fill user ID"""
-    def _get():
+    def _get(config):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
             url = "https://api.clockify.me/api/v1/user"
-            res = requests.get(url, headers=headers, timeout=10)
+            res = get_http_session().get(url, timeout=_HTTP_TIMEOUT)
             
             if res.status_code == 200:
-                user_data = res.json()
-                api_queue.put(('user_info', user_data, callback))
+                user_data = _json_loads(res.content)
+                post_api_result('user_info', user_data, callback)
             else:
-                api_queue.put(('error', f"Failed to get user info: {res.status_code}", callback))
+                post_api_result('error', f"Failed to get user info: {res.status_code}", callback)
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
-    
-    thread = threading.Thread(target=_get, daemon=True)
-    thread.start()
+            post_api_result('error', f"Network error: {str(e)}", callback)
+    
+    submit_api_task(_get, get_api_config())
+
+def request_current_timer(workspace_id, user_id):
+    """Request the in-progress time entry, returning an (action, data) pair for the API queue"""
+    global _current_timer_cache
+    url = f"https://api.clockify.me/api/v1/workspaces/{workspace_id}/user/{user_id}/time-entries?in-progress=true"
+    generation = _current_timer_generation
+    res = get_http_session().get(url, timeout=_HTTP_TIMEOUT)
+    
+    if res.status_code == 200:
+        timer_list = _json_loads(res.content)
+        current_timer = timer_list[0] if timer_list else None
+        with _current_timer_cache_lock:
+            # Skip caching if the timer was started or stopped while this GET was out
+            if generation == _current_timer_generation:
+                _current_timer_cache = (time.monotonic(), ('current_timer', workspace_id, user_id), current_timer)
+        return 'current_timer', current_timer
+    return 'error', f"Failed to get current timer: {res.status_code}"
 
 def get_current_timer_async(callback=None):
-    """Get current timer in a separate thread"""
-    def _get():
+    """Get current timer on a pooled worker thread"""
+    def _get(config, request_key):
         try:
-            prefs = get_preferences()
-            headers = get_api_headers()
-            
-            url = f"https://api.clockify.me/api/v1/workspaces/{prefs.workspace_id}/user/{prefs.user_id}/time-entries?in-progress=true"
-            res = requests.get(url, headers=headers, timeout=10)
-            
-            if res.status_code == 200:
-                timer_list = res.json()
-                current_timer = timer_list[0] if timer_list else None
-                api_queue.put(('current_timer', current_timer, callback))
-            else:
-                api_queue.put(('error', f"Failed to get current timer: {res.status_code}", callback))
+            action, data = request_current_timer(config['workspace_id'], config['user_id'])
         except Exception as e:
-            api_queue.put(('error', f"Network error: {str(e)}", callback))
+            action, data = 'error', f"Network error: {str(e)}"
+        finish_inflight_request(request_key, action, data)
+    
+    config = get_api_config()
+    request_key = ('current_timer', config['workspace_id'], config['user_id'])
+    
+    # Serve a recent answer without a worker or network round trip
+    cached = _current_timer_cache
+    if cached and cached[1] == request_key and time.monotonic() - cached[0] < _CURRENT_TIMER_CACHE_TTL:
+        post_api_result('current_timer', cached[2], callback)
+        wake_api_queue_processor()
+        return
     
-    thread = threading.Thread(target=_get, daemon=True)
-    thread.start()
+    if join_inflight_request(request_key, callback):
+        submit_api_task(_get, config, request_key)
 
 # --- MAIN THREAD CALLBACKS ---
 @safe_context_access  
@@ -809,19 +1197,15 @@ def handle_clients_response(action, data):
     if action == 'clients_fetched':
         set_cached_clients(data)
         scene = bpy.context.scene
-        if hasattr(scene, 'clockify_client'):
-            current_selection = scene.clockify_client
+        current_selection = scene.clockify_client
+        if is_cached_client_id(current_selection):
+            scene.clockify_client = current_selection
+        else:
+            # Set to first client or CREATE_NEW if no clients
             cached_clients = get_cached_clients()
-            if current_selection in [c[0] for c in cached_clients]:
-                scene.clockify_client = current_selection
-            else:
-                # Set to first client or CREATE_NEW if no clients
-                scene.clockify_client = cached_clients[0][0] if cached_clients else "CREATE_NEW"
-                
-            if bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
+            scene.clockify_client = cached_clients[0][0] if cached_clients else "CREATE_NEW"
+            
+        request_redraw('VIEW_3D')
 
 @safe_context_access
 def handle_client_created_new(action, data):
@@ -842,7 +1226,7 @@ def handle_client_created_new(action, data):
                 scene.clockify_new_client_name = ""
                 scene.clockify_status = f"✅ Client '{client_name}' created successfully!"
         
-        fetch_clients_async(refresh_clients_callback)
+        fetch_clients_async(refresh_clients_callback, join=False)
 
 @safe_context_access  
 def handle_projects_response(action, data):
@@ -850,18 +1234,14 @@ def handle_projects_response(action, data):
     if action == 'projects_fetched':
         set_cached_projects(data)
         scene = bpy.context.scene
-        if hasattr(scene, 'clockify_project'):
-            current_selection = scene.clockify_project
+        current_selection = scene.clockify_project
+        if is_cached_project_id(current_selection):
+            scene.clockify_project = current_selection
+        else:
             cached_projects = get_cached_projects()
-            if current_selection in [p[0] for p in cached_projects]:
-                scene.clockify_project = current_selection
-            else:
-                scene.clockify_project = cached_projects[0][0] if cached_projects else "CREATE_NEW"
-                
-            if bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
+            scene.clockify_project = cached_projects[0][0] if cached_projects else "CREATE_NEW"
+            
+        request_redraw('VIEW_3D')
 
 @safe_context_access  
 def handle_projects_response_full(action, data):
@@ -875,29 +1255,44 @@ def handle_projects_response_full(action, data):
         set_cached_projects(projects_simple)  # Keep existing cache updated too
         
         scene = bpy.context.scene
-        if hasattr(scene, 'clockify_project'):
-            current_selection = scene.clockify_project
-            # Check if current selection is still valid for the selected client
-            valid_projects = [p[0] for p in get_filtered_projects_for_client(scene.clockify_client)]
-            
-            if current_selection in valid_projects:
-                scene.clockify_project = current_selection
+        current_selection = scene.clockify_project
+        # Check if current selection is still valid for the selected client
+        if is_project_for_client(current_selection, scene.clockify_client):
+            scene.clockify_project = current_selection
+        else:
+            # Reset to first available project or CREATE_NEW
+            valid_projects = get_filtered_projects_for_client(scene.clockify_client)
+            if valid_projects:
+                scene.clockify_project = valid_projects[0][0]
             else:
-                # Reset to first available project or CREATE_NEW
-                if valid_projects:
-                    scene.clockify_project = valid_projects[0]
-                else:
-                    scene.clockify_project = "CREATE_NEW"
-                
-            if bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
+                scene.clockify_project = "CREATE_NEW"
+            
+        request_redraw('VIEW_3D')
+
+@safe_context_access
+def handle_bootstrap_response(action, data):
+    """Handle the combined clients + projects startup response in main thread"""
+    if action == 'bootstrap_done':
+        # Clients first so project filtering sees the restored client selection
+        handle_clients_response('clients_fetched', data['clients'])
+        handle_projects_response_full('projects_fetched_full', {
+            'full': data['projects_full'],
+            'simple': data['projects_simple']
+        })
+        
+        # A timer restored at startup may have arrived before the project names
+        scene = bpy.context.scene
+        project_name = get_project_name_by_id(scene.clockify_active_project, None)
+        if project_name is not None:
+            assign_if_changed(scene, 'clockify_active_project_name', project_name)
 
 @safe_context_access
 def handle_timer_started(action, timer_data, project_name=None, client_name=None):
     """Handle timer started response in main thread"""
+    global _last_reset_prompt_ts
     if action == 'timer_started':
+        # A new session re-arms the "no active timer" prompt
+        _last_reset_prompt_ts = 0.0
         set_timer_start_time(time.time())
         
         scene = bpy.context.scene
@@ -917,17 +1312,10 @@ def handle_timer_started(action, timer_data, project_name=None, client_name=None
             scene.clockify_project = timer_data['projectId']
         
         # Ensure timer display updates are running
-        if not bpy.app.timers.is_registered(update_timer_display):
-            bpy.app.timers.register(update_timer_display, first_interval=1.0)
+        _start_display_ticker()
         
         # Force immediate UI update
-        try:
-            if bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type in ['TOPBAR', 'VIEW_3D']:
-                        area.tag_redraw()
-        except Exception as e:
-            print(f"Error forcing UI update: {e}")
+        request_redraw('TOPBAR', 'VIEW_3D')
 
 @safe_context_access
 def handle_timer_stopped(action, timer_data):
@@ -935,8 +1323,13 @@ def handle_timer_stopped(action, timer_data):
     if action == 'timer_stopped':
         # Get the duration before clearing
         duration = get_last_session_duration()
-        billing = calculate_billing_info(duration)
-        prefs = get_preferences()
+        prefs = get_preferences_cached()
+        (show_elapsed, show_billable, show_last_session, show_project,
+         show_task, show_client, hourly_rate) = (
+            prefs['show_elapsed_time'], prefs['show_billable'], prefs['show_last_session'],
+            prefs['show_project_name'], prefs['show_task_name'], prefs['show_client_name'],
+            prefs['hourly_rate'])
+        billing = calculate_billing_info(duration, hourly_rate)
         
         set_timer_start_time(None)
         
@@ -947,85 +1340,122 @@ def handle_timer_stopped(action, timer_data):
         project_id = timer_data.get('projectId', '') if timer_data else ''
         
         # Find project name from cached projects
-        project_name = "Unknown Project"
-        if project_id:
-            cached_projects = get_cached_projects()
-            for p in cached_projects:
-                if p[0] == project_id:
-                    project_name = p[1]
-                    break
+        project_name = get_project_name_by_id(project_id) if project_id else "Unknown Project"
         
         # Get client name from scene (this should still be available)
-        client_name = scene.clockify_active_client_name if hasattr(scene, 'clockify_active_client_name') and scene.clockify_active_client_name else ""
+        client_name = scene.clockify_active_client_name
         
         # Show billing summary
         duration_str = format_duration_detailed(duration)
         billing_str = f"${billing['billable_amount']:.2f}"
         hours_str = f"{billing['hours']:.2f}h"
+        rate_str = f"@ ${billing['rate']}/hr"
         
         # Create status message based on preferences
         status_parts = [f"✅ Session complete: {duration_str}"]
-        if prefs.show_elapsed_time:
+        if show_elapsed:
             status_parts.append(hours_str)
-        if prefs.show_billable:
-            status_parts.append(f"{billing_str} @ ${billing['rate']}/hr")
-        
-        scene.clockify_status = " • ".join(status_parts)
+        if show_billable:
+            status_parts.append(f"{billing_str} {rate_str}")
+        status = " • ".join(status_parts)
         
         # Create comprehensive session summary if enabled
-        if prefs.show_last_session:
+        summary = ""
+        if show_last_session:
             summary_parts = []
-            if prefs.show_project_name:
+            if show_project:
                 summary_parts.append(f"Project: {project_name}")
-            if prefs.show_task_name:
+            if show_task:
                 summary_parts.append(f"Task: {task_desc}")
-            if prefs.show_client_name and client_name:
+            if show_client and client_name:
                 summary_parts.append(f"Client: {client_name}")
-            if prefs.show_elapsed_time:
+            if show_elapsed:
                 summary_parts.append(f"Duration: {duration_str}")
-            if prefs.show_billable:
-                summary_parts.append(f"Billable: {billing_str} ({hours_str} @ ${billing['rate']}/hr)")
-            
-            scene.clockify_last_session_summary = "\n".join(summary_parts)
-        else:
-            scene.clockify_last_session_summary = ""
+            if show_billable:
+                summary_parts.append(f"Billable: {billing_str} ({hours_str} {rate_str})")
+            summary = "\n".join(summary_parts)
+        
+        # Only write RNA properties that actually change
+        assign_if_changed(scene, 'clockify_status', status)
+        assign_if_changed(scene, 'clockify_last_session_summary', summary)
+        
+        _stop_display_ticker()
         
         # Clear active timer info AFTER capturing the data
-        scene.clockify_active_timer_id = ""
-        scene.clockify_active_timer_desc = ""
-        scene.clockify_active_project = ""
-        scene.clockify_active_project_name = ""
-        scene.clockify_active_client_name = ""
+        clear_active_timer_properties(scene)
         
         # Force redraw to show the summary in the panel
-        if bpy.context.screen:
-            for area in bpy.context.screen.areas:
-                if area.type in ['TOPBAR', 'VIEW_3D']:
-                    area.tag_redraw()
+        request_redraw('TOPBAR', 'VIEW_3D')
 
 @safe_context_access
 def handle_no_active_timer():
     """Handle the case when no active timer is found in Clockify"""
-    global _reset_prompt_shown
+    global _last_reset_prompt_ts
     
     # Prevent double prompts
-    if not _reset_prompt_shown:
-        _reset_prompt_shown = True
+    now = time.monotonic()
+    if now - _last_reset_prompt_ts > _RESET_PROMPT_DEBOUNCE:
+        _last_reset_prompt_ts = now
         bpy.ops.clockify.reset_timer_prompt('INVOKE_DEFAULT')
 
+@functools.lru_cache(maxsize=64)
+def parse_timer_start(start_time_str):
+    """Convert a Clockify ISO start time to epoch seconds, cached per string.
+    
+    Clockify sends UTC as YYYY-MM-DDTHH:MM:SSZ, optionally with a fraction
+    before the Z, so that form is sliced directly; anything else falls back
+    to datetime.fromisoformat.
+    """
+    s = start_time_str
+    if len(s) >= 20 and s[-1] == 'Z' and s[10] == 'T':
+        fraction = s[19:-1]
+        try:
+            if not fraction or fraction[0] == '.':
+                microsecond = int(fraction[1:7].ljust(6, '0')) if fraction else 0
+                return datetime(
+                    int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                    microsecond, tzinfo=timezone.utc
+                ).timestamp()
+        except ValueError:
+            pass
+    return datetime.fromisoformat(s.replace('Z', '+00:00')).timestamp()
+
 @safe_context_access
 def handle_current_timer(action, data):
     """Handle current timer response in main thread"""
+    global _last_current_timer_state
     if action == 'current_timer':
         scene = bpy.context.scene
         if data:
             desc = data.get('description', 'No description')
             project_id = data.get('projectId', '')
-            
+            project_name = get_project_name_by_id(project_id, None)
+            if project_name is None:
+                # Projects load on the first panel draw; until then keep the name saved with the scene
+                if project_id == scene.clockify_active_project and scene.clockify_active_project_name:
+                    project_name = scene.clockify_active_project_name
+                else:
+                    project_name = "Unknown Project"
+            new_state = (data['id'], desc, project_id, project_name)
+            status = f"Timer running: {desc}"
+        else:
+            new_state = None
+            status = "No timer currently running"
+        
+        # Unchanged poll for the state already applied locally: nothing to write or redraw
+        if (new_state == _last_current_timer_state
+                and scene.clockify_active_timer_id == (data['id'] if data else "")
+                and (not data or get_timer_start_time() is not None)):
+            if assign_if_changed(scene, 'clockify_status', status):
+                request_redraw('VIEW_3D')
+            return
+        _last_current_timer_state = new_state
+        
+        if data:
             start_time_str = data['timeInterval']['start']
             try:
-                start_time_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                set_timer_start_time(start_time_dt.timestamp())
+                set_timer_start_time(parse_timer_start(start_time_str))
             except Exception as e:
                 print(f"Error parsing start time: {e}")
                 set_timer_start_time(time.time())
@@ -1034,58 +1464,59 @@ def handle_current_timer(action, data):
             scene.clockify_active_timer_desc = desc
             scene.clockify_active_project = project_id
             
-            project_name = "Unknown Project"
-            cached_projects = get_cached_projects()
-            for p in cached_projects:
-                if p[0] == project_id:
-                    project_name = p[1]
-                    break
             scene.clockify_active_project_name = project_name
             
             # Try to find client name from project (this would require additional API call)
             scene.clockify_active_client_name = ""
             
-            scene.clockify_status = f"Timer running: {desc}"
+            scene.clockify_status = status
             
-            if not bpy.app.timers.is_registered(update_timer_display):
-                bpy.app.timers.register(update_timer_display, first_interval=1.0)
+            _start_display_ticker()
         else:
             set_timer_start_time(None)
+            _stop_display_ticker()
             
-            scene.clockify_status = "No timer currently running"
-            scene.clockify_active_timer_id = ""
-            scene.clockify_active_timer_desc = ""
-            scene.clockify_active_project = ""
-            scene.clockify_active_project_name = ""
-            scene.clockify_active_client_name = ""
+            scene.clockify_status = status
+            clear_active_timer_properties(scene)
         
         # Force UI redraw after updating timer status
-        if bpy.context.screen:
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        request_redraw('TOPBAR', 'VIEW_3D')
 
 @safe_context_access
 def handle_project_summary(action, data):
     """Handle project summary response in main thread"""
+    global _last_project_summary_state
     if action == 'project_summary':
         scene = bpy.context.scene
-        prefs = get_preferences()
         
         total_seconds = data['total_seconds']
         entries_count = data['entries_count']
+        hourly_rate = get_preferences_cached()['hourly_rate']
         
         duration_str = format_duration_detailed(total_seconds)
-        billing = calculate_billing_info(total_seconds)
-        
-        scene.clockify_project_summary = f"This Month: {duration_str} ({entries_count} sessions)\nBillable: ${billing['billable_amount']:.2f} ({billing['hours']:.2f}h @ ${prefs.hourly_rate}/hr)"
-        scene.clockify_status = f"Project status updated: {duration_str} this month"
+        status = f"Project status updated: {duration_str} this month"
+        
+        # Same totals at the same rate: the summary text is already current
+        new_state = (total_seconds, entries_count, hourly_rate)
+        if new_state == _last_project_summary_state and scene.clockify_project_summary:
+            if assign_if_changed(scene, 'clockify_status', status):
+                request_redraw('VIEW_3D')
+            return
+        _last_project_summary_state = new_state
+        
+        billing = calculate_billing_info(total_seconds, hourly_rate)
+        
+        scene.clockify_project_summary = _PROJECT_SUMMARY_FMT.format(
+            dur=duration_str,
+            n=entries_count,
+            amt=billing['billable_amount'],
+            hr=billing['hours'],
+            rate=hourly_rate
+        )
+        scene.clockify_status = status
         
         # Force UI redraw after updating project summary
-        if bpy.context.screen:
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        request_redraw('VIEW_3D')
 
 @safe_context_access
 def handle_user_info(action, data):
@@ -1101,117 +1532,173 @@ def handle_user_info(action, data):
         print(f"Auto-filled User ID: {data['id']}")
         
         # Show success message
-        def show_message():
-            bpy.context.scene.clockify_status = f"✅ Credentials verified! User: {data.get('name', 'Unknown')}"
-            return None
-        bpy.app.timers.register(show_message, first_interval=0.01)
+        bpy.context.scene.clockify_status = f"✅ Credentials verified! User: {data.get('name', 'Unknown')}"
+        request_redraw('VIEW_3D')
 
 # --- BACKGROUND TASK PROCESSOR ---
+def tag_redraw_types(area_types=frozenset({'VIEW_3D', 'TOPBAR'})):
+    """Tag every area of the given types for redraw in a single pass over the windows
+    
+    For VIEW_3D only the sidebar (UI region) is tagged: the panel lives there,
+    and the viewport itself has nothing of ours to redraw.
+    """
+    try:
+        window_manager = bpy.context.window_manager if bpy.context else None
+        if not window_manager:
+            return
+        for window in window_manager.windows:
+            screen = window.screen
+            if screen:
+                for area in screen.areas:
+                    area_type = area.type
+                    if area_type not in area_types:
+                        continue
+                    if area_type == 'VIEW_3D':
+                        for region in area.regions:
+                            if region.type == 'UI':
+                                region.tag_redraw()
+                    else:
+                        area.tag_redraw()
+    except Exception as e:
+        print(f"Error redrawing UI: {e}")
+
+def request_redraw(*area_types):
+    """Mark area types for redraw at the end of the next queue pass
+    
+    The single redraw path for code that changed a scene property; VIEW_3D
+    means the sidebar region, see tag_redraw_types.
+    """
+    _pending_redraw_areas.update(area_types)
+
+def flush_pending_redraws():
+    """Tag all requested area types for redraw in a single pass over the windows"""
+    if not _pending_redraw_areas:
+        return
+    
+    area_types = frozenset(_pending_redraw_areas)
+    _pending_redraw_areas.clear()
+    tag_redraw_types(area_types)
+
+# Queue action -> main-thread handler taking (action, data)
+_ACTION_HANDLERS = {
+    'clients_fetched': handle_clients_response,
+    'projects_fetched_full': handle_projects_response_full,
+    'bootstrap_done': handle_bootstrap_response,
+    'client_created_new': handle_client_created_new,
+    'projects_fetched': handle_projects_response,
+    'project_summary': handle_project_summary,
+    'current_timer': handle_current_timer,
+    'timer_started': handle_timer_started,
+    'timer_stopped': handle_timer_stopped,
+    'user_info': handle_user_info,
+}
+
+def dispatch_api_item(action, data):
+    """Run the main-thread handler for a single API queue item"""
+    handler = _ACTION_HANDLERS.get(action)
+    if handler:
+        handler(action, data)
+    elif action == 'no_active_timer':
+        handle_no_active_timer()
+    elif action == 'error':
+        # Handle error messages (already on the main thread)
+        if bpy.context and bpy.context.scene:
+            bpy.context.scene.clockify_status = f"Error: {data}"
+            request_redraw('VIEW_3D')
+
+def run_main_thread_calls(max_calls):
+    """Run up to max_calls deferred callables from _main_thread_queue"""
+    for _ in range(max_calls):
+        try:
+            func = _main_thread_queue.get_nowait()
+        except Empty:
+            break
+        try:
+            func()
+        except Exception as e:
+            print(f"Error in main thread call: {e}")
+
+@contextlib.contextmanager
+def batched_scene_updates():
+    """Defer UI redraws until the outermost batch exits (reentrant)"""
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            flush_pending_redraws()
+
+def wake_api_queue_processor():
+    """Reset the polling backoff and bring the next process_api_queue tick forward"""
+    global _idle_ticks
+    _idle_ticks = 0
+    # Inside a queue pass the processor already returns its fastest interval
+    if _batch_depth:
+        return
+    if bpy.app.timers.is_registered(process_api_queue):
+        bpy.app.timers.unregister(process_api_queue)
+        bpy.app.timers.register(process_api_queue, first_interval=_QUEUE_POLL_MIN, persistent=True)
+
 @safe_context_access
 def process_api_queue():
     """Process API responses in the main thread"""
-    processed_items = 0
+    global _idle_ticks
+    
+    # Idle tick: nothing arrived and nothing to redraw, so back off exponentially
+    if api_queue.empty() and _main_thread_queue.empty() and not _pending_redraw_areas:
+        interval = min(_QUEUE_POLL_MAX, _QUEUE_POLL_MIN * (2 ** _idle_ticks))
+        if interval < _QUEUE_POLL_MAX:
+            _idle_ticks += 1
+        return interval
+    
+    # Handlers access scene properties directly, so hold items until they exist
+    if not _scene_properties_registered:
+        return _QUEUE_POLL_MAX
+    
+    _idle_ticks = 0
+    
     max_items_per_call = 10
-    ui_needs_redraw = False
     
-    while not api_queue.empty() and processed_items < max_items_per_call:
+    # Drain a bounded batch first so repeated snapshot responses can be coalesced
+    items = []
+    for _ in range(max_items_per_call):
         try:
-            action, data, callback = api_queue.get_nowait()
-            
-            if action == 'clients_fetched':
-                handle_clients_response(action, data)
-                ui_needs_redraw = True
-            elif action == 'projects_fetched_full':
-                handle_projects_response_full(action, data)
-                ui_needs_redraw = True
-            elif action == 'client_created_new':
-                handle_client_created_new(action, data)
-                ui_needs_redraw = True
-            elif action == 'projects_fetched':
-                handle_projects_response(action, data)
-                ui_needs_redraw = True
-            elif action == 'project_summary':
-                handle_project_summary(action, data)
-                ui_needs_redraw = True
-            elif action == 'current_timer':
-                handle_current_timer(action, data)
-                ui_needs_redraw = True
-            elif action == 'timer_started':
-                handle_timer_started(action, data)
-                ui_needs_redraw = True
-            elif action == 'timer_stopped':
-                handle_timer_stopped(action, data)
-                ui_needs_redraw = True
-            elif action == 'no_active_timer':
-                handle_no_active_timer()
-                ui_needs_redraw = True
-            elif action == 'user_info':
-                handle_user_info(action, data)
-                ui_needs_redraw = True
-            elif action == 'error':
-                # Handle error messages
-                def show_error():
-                    if bpy.context and bpy.context.scene:
-                        bpy.context.scene.clockify_status = f"Error: {data}"
-                    return None
-                bpy.app.timers.register(show_error, first_interval=0.01)
-                ui_needs_redraw = True
+            items.append(api_queue.get_nowait())
+        except Empty:
+            break
+    
+    # Last write wins for coalesced actions; everything else applies in order
+    last_index = {item[0]: i for i, item in enumerate(items)}
+    held_callbacks = {}  # coalesced action -> callbacks of its superseded items
+    
+    with batched_scene_updates():
+        for i, (action, data, callback) in enumerate(items):
+            if action in _COALESCED_ACTIONS and last_index[action] != i:
+                # Callbacks still run, but only once the newest item has been applied
+                if callback:
+                    held_callbacks.setdefault(action, []).append((callback, data))
+                continue
             
+            callbacks = held_callbacks.pop(action, [])
             if callback:
+                callbacks.append((callback, data))
+            try:
+                dispatch_api_item(action, data)
+            except Exception as e:
+                print(f"Error processing API queue item: {e}")
+            
+            for item_callback, item_data in callbacks:
                 try:
-                    callback(action, data)
+                    item_callback(action, item_data)
                 except Exception as e:
                     print(f"Error in callback: {e}")
-            
-            processed_items += 1
-                
-        except Empty:
-            break
-        except Exception as e:
-            print(f"Error processing API queue item: {e}")
-            processed_items += 1
-            continue
-    
-    # Force comprehensive UI redraw
-    try:
-        if bpy.context and bpy.context.window_manager:
-            for window in bpy.context.window_manager.windows:
-                if window.screen:
-                    for area in window.screen.areas:
-                        if area.type in ['VIEW_3D', 'TOPBAR']:
-                            area.tag_redraw()
-        
-        # Fallback to context screen
-        if bpy.context and bpy.context.screen:
-            for area in bpy.context.screen.areas:
-                if area.type in ['VIEW_3D', 'TOPBAR']:
-                    area.tag_redraw()
-                    
-    except Exception as e:
-        print(f"Error redrawing UI: {e}")
-            
-    return 0.1
+        
+        # Deferred calls queued by the callbacks above run in this same pass
+        run_main_thread_calls(max_items_per_call)
     
-    # Force UI redraw for all relevant areas if any significant updates occurred
-    if ui_needs_redraw:
-        try:
-            if bpy.context and bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type in ['VIEW_3D', 'TOPBAR']:
-                        area.tag_redraw()
-        except Exception as e:
-            print(f"Error redrawing UI: {e}")
-    else:
-        # Always redraw top bar to ensure timer display updates
-        try:
-            if bpy.context and bpy.context.screen:
-                for area in bpy.context.screen.areas:
-                    if area.type == 'TOPBAR':
-                        area.tag_redraw()
-        except Exception as e:
-            print(f"Error redrawing topbar: {e}")
-            
-    return 0.1
+    return _QUEUE_POLL_MIN
 
 # --- EVENT HANDLERS ---
 @bpy.app.handlers.persistent
@@ -1222,11 +1709,10 @@ def save_pre_handler(dummy):
 @bpy.app.handlers.persistent  
 def load_post_handler(dummy):
     """Handler called after loading blend file"""
-    # Small delay to ensure scene is fully loaded
-    def delayed_load():
-        load_task_description_from_file()
-        return None
-    bpy.app.timers.register(delayed_load, first_interval=0.5)
+    # Small delay to ensure scene is fully loaded; rapid reloads share one pending timer
+    if bpy.app.timers.is_registered(load_task_description_from_file):
+        return
+    bpy.app.timers.register(load_task_description_from_file, first_interval=0.5)
 
 # --- UPDATE FUNCTIONS ---
 def client_selection_update(self, context):
@@ -1238,32 +1724,23 @@ def client_selection_update(self, context):
         
         # Update the cached client ID when selection changes
         if self.clockify_client != "NONE":
-            cached_clients = get_cached_clients()
-            for c in cached_clients:
-                if c[0] == self.clockify_client:
-                    set_cached_client_id(self.clockify_client)
-                    break
+            if is_cached_client_id(self.clockify_client):
+                set_cached_client_id(self.clockify_client)
         else:
             # Set client ID to None for "NONE" selection
             set_cached_client_id(None)
         
-        # Filter projects based on selected client
-        filtered_projects = get_filtered_projects_for_client(self.clockify_client)
-        
         # Update project selection to first available project or CREATE_NEW
         if hasattr(self, 'clockify_project'):
             current_project = self.clockify_project
-            valid_project_ids = [p[0] for p in filtered_projects]
             
-            if current_project not in valid_project_ids and current_project != "CREATE_NEW":
+            if current_project != "CREATE_NEW" and not is_project_for_client(current_project, self.clockify_client):
                 # Reset to first available project or CREATE_NEW
-                self.clockify_project = valid_project_ids[0] if valid_project_ids else "CREATE_NEW"
+                filtered_projects = get_filtered_projects_for_client(self.clockify_client)
+                self.clockify_project = filtered_projects[0][0] if filtered_projects else "CREATE_NEW"
         
         # Force UI refresh to update project dropdown
-        if hasattr(bpy, 'context') and bpy.context and bpy.context.screen:
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    area.tag_redraw()
+        request_redraw('VIEW_3D')
 
 def project_selection_update(self, context):
     """Called when project selection changes"""
@@ -1272,6 +1749,102 @@ def project_selection_update(self, context):
     else:
         self.clockify_show_new_project_field = False
 
+# --- OPERATOR CALLBACKS ---
+def schedule_on_main(func, *args, **kwargs):
+    """Run func(*args, **kwargs) once on the main thread during the next queue pass"""
+    _main_thread_queue.put_nowait(functools.partial(func, *args, **kwargs))
+
+@safe_context_access
+def set_status_on_main(text):
+    """Set the scene status line"""
+    if assign_if_changed(bpy.context.scene, 'clockify_status', text):
+        request_redraw('VIEW_3D')
+
+def select_project_after_refresh(action, data, *, project_id):
+    """Select a newly created project once the refreshed project list arrives"""
+    if action == 'projects_fetched_full':
+        bpy.context.scene.clockify_project = project_id
+
+def apply_timer_started(data, project_name, client_name, refresh_project_id=None):
+    """Apply a started timer, refreshing projects first if one was just created"""
+    handle_timer_started('timer_started', data, project_name, client_name)
+    if refresh_project_id:
+        # Refresh projects list to include the new project
+        fetch_projects_async(functools.partial(select_project_after_refresh, project_id=refresh_project_id), join=False)
+
+def on_timer_started(action, data, *, project_name, client_name, error_prefix="Error", refresh_project_id=None):
+    """Callback for start_timer_async issued by the Start Timer operator"""
+    try:
+        if action == 'timer_started':
+            schedule_on_main(apply_timer_started, data, project_name, client_name, refresh_project_id)
+        elif action == 'error':
+            schedule_on_main(set_status_on_main, f"{error_prefix}: {data}")
+    finally:
+        set_operation_in_progress("start", False)
+
+def on_project_created_for_start(action, data, *, desc, client_name):
+    """Callback for create_project_async: start the timer on the new project"""
+    if action == 'project_created':
+        project_id = data['id']
+        bpy.context.scene.clockify_status = "Starting timer..."
+        start_timer_async(desc, project_id, functools.partial(
+            on_timer_started,
+            project_name=data['name'],
+            client_name=client_name,
+            error_prefix="Error starting timer",
+            refresh_project_id=project_id
+        ))
+    elif action == 'error':
+        schedule_on_main(set_status_on_main, f"Error creating project: {data}")
+        set_operation_in_progress("start", False)
+
+def on_client_created_for_start(action, data, *, desc, project):
+    """Callback for create_client_async: continue with project selection/creation"""
+    if action == 'client_created_new':
+        schedule_on_main(CLOCKIFY_OT_StartTimer.handle_project_and_start_timer_fixed, desc, project, data['name'])
+    elif action == 'error':
+        schedule_on_main(set_status_on_main, f"Error creating client: {data}")
+
+def on_timer_stopped(action, data):
+    """Callback for stop_timer_async issued by the Stop Timer operator"""
+    try:
+        if action == 'timer_stopped':
+            schedule_on_main(handle_timer_stopped, action, data)
+        elif action == 'no_active_timer':
+            schedule_on_main(handle_no_active_timer)
+        elif action == 'error':
+            schedule_on_main(set_status_on_main, f"Error stopping timer: {data}")
+    finally:
+        set_operation_in_progress("stop", False)
+
+def on_project_status(action, data):
+    """Callback for get_project_summary_async issued by the Project Status operator"""
+    try:
+        if action == 'error':
+            schedule_on_main(set_status_on_main, f"Error getting project status: {data}")
+    finally:
+        set_operation_in_progress("status", False)
+
+def on_clients_refreshed(action, data):
+    """Callback for fetch_clients_async issued by the Refresh Clients operator"""
+    try:
+        if action == 'clients_fetched':
+            schedule_on_main(set_status_on_main, "Clients refreshed successfully!")
+        elif action == 'error':
+            schedule_on_main(set_status_on_main, f"Error refreshing clients: {data}")
+    finally:
+        set_operation_in_progress("refresh_clients", False)
+
+def on_projects_refreshed(action, data):
+    """Callback for fetch_projects_async issued by the Refresh Projects operator"""
+    try:
+        if action == 'projects_fetched_full':
+            schedule_on_main(set_status_on_main, "Projects refreshed successfully!")
+        elif action == 'error':
+            schedule_on_main(set_status_on_main, f"Error refreshing projects: {data}")
+    finally:
+        set_operation_in_progress("refresh_projects", False)
+
 # --- OPERATORS ---
 class CLOCKIFY_OT_StartTimer(bpy.types.Operator):
     bl_idname = "clockify.start_timer"
@@ -1295,51 +1868,28 @@ class CLOCKIFY_OT_StartTimer(bpy.types.Operator):
                 return {'CANCELLED'}
             
             scene.clockify_status = "Creating client..."
-            
-            def client_created_callback(action, data):
-                if action == 'client_created_new':
-                    # Client created, now handle project creation/selection
-                    # Use a timer to call the method in the main thread context
-                    def continue_with_project():
-                        self.handle_project_and_start_timer_fixed(desc, project)
-                        return None
-                    bpy.app.timers.register(continue_with_project, first_interval=0.01)
-                elif action == 'error':
-                    def main_thread_error():
-                        scene.clockify_status = f"Error creating client: {data}"
-                        return None
-                    bpy.app.timers.register(main_thread_error, first_interval=0.01)
-            
-            create_client_async(new_client_name, client_created_callback)
+            create_client_async(new_client_name, functools.partial(on_client_created_for_start, desc=desc, project=project))
         else:
-            # Set the selected client ID
+            # Set the selected client ID, resolving its display name in the same lookup
+            client_name = ""
             if client != "NONE":
-                cached_clients = get_cached_clients()
-                for c in cached_clients:
-                    if c[0] == client:
-                        set_cached_client_id(client)
-                        break
+                cached_name = get_client_name_by_id(client, None)
+                if cached_name is not None:
+                    client_name = cached_name
+                    set_cached_client_id(client)
             else:
                 set_cached_client_id(None)
             
             # Handle project creation/selection
-            self.handle_project_and_start_timer_fixed(desc, project)
+            self.handle_project_and_start_timer_fixed(desc, project, client_name)
         
         return {'FINISHED'}
     
-    def handle_project_and_start_timer_fixed(self, desc, project):
+    @staticmethod
+    def handle_project_and_start_timer_fixed(desc, project, client_name=""):
         """Fixed version that works in timer callback context"""
         scene = bpy.context.scene
         
-        # Get client name for timer display
-        client_name = ""
-        if hasattr(scene, 'clockify_client') and scene.clockify_client not in ["CREATE_NEW", "NONE"]:
-            cached_clients = get_cached_clients()
-            for c in cached_clients:
-                if c[0] == scene.clockify_client:
-                    client_name = c[1]
-                    break
-        
         if project == "CREATE_NEW":
             new_project_name = scene.clockify_new_project_name.strip()
             if not new_project_name:
@@ -1348,72 +1898,15 @@ class CLOCKIFY_OT_StartTimer(bpy.types.Operator):
             
             set_operation_in_progress("start", True)
             scene.clockify_status = "Creating project..."
-            
-            def project_created_callback(action, data):
-                if action == 'project_created':
-                    project_id = data['id']
-                    project_name = data['name']
-                    scene.clockify_status = "Starting timer..."
-                    
-                    def timer_started_callback(action, data):
-                        try:
-                            if action == 'timer_started':
-                                def main_thread_update():
-                                    handle_timer_started(action, data, project_name, client_name)
-                                    # Refresh projects list to include the new project
-                                    def refresh_projects_callback(refresh_action, refresh_data):
-                                        if refresh_action == 'projects_fetched_full':
-                                            scene.clockify_project = project_id
-                                    fetch_projects_async(refresh_projects_callback)
-                                    return None
-                                bpy.app.timers.register(main_thread_update, first_interval=0.01)
-                            elif action == 'error':
-                                def main_thread_error():
-                                    scene.clockify_status = f"Error starting timer: {data}"
-                                    return None
-                                bpy.app.timers.register(main_thread_error, first_interval=0.01)
-                        finally:
-                            set_operation_in_progress("start", False)
-                    
-                    start_timer_async(desc, project_id, timer_started_callback)
-                    
-                elif action == 'error':
-                    def main_thread_error():
-                        scene.clockify_status = f"Error creating project: {data}"
-                        return None
-                    bpy.app.timers.register(main_thread_error, first_interval=0.01)
-                    set_operation_in_progress("start", False)
-            
-            create_project_async(new_project_name, project_created_callback)
+            create_project_async(new_project_name, functools.partial(on_project_created_for_start, desc=desc, client_name=client_name))
             
         else:
             set_operation_in_progress("start", True)
             scene.clockify_status = "Starting timer..."
             
             # Get project name
-            project_name = "Unknown Project"
-            cached_projects = get_cached_projects()
-            for p in cached_projects:
-                if p[0] == project:
-                    project_name = p[1]
-                    break
-            
-            def timer_started_callback(action, data):
-                try:
-                    if action == 'timer_started':
-                        def main_thread_update():
-                            handle_timer_started(action, data, project_name, client_name)
-                            return None
-                        bpy.app.timers.register(main_thread_update, first_interval=0.01)
-                    elif action == 'error':
-                        def main_thread_error():
-                            scene.clockify_status = f"Error: {data}"
-                            return None
-                        bpy.app.timers.register(main_thread_error, first_interval=0.01)
-                finally:
-                    set_operation_in_progress("start", False)
-            
-            start_timer_async(desc, project, timer_started_callback)
+            project_name = get_project_name_by_id(project)
+            start_timer_async(desc, project, functools.partial(on_timer_started, project_name=project_name, client_name=client_name))
 
 class CLOCKIFY_OT_StopTimer(bpy.types.Operator):
     bl_idname = "clockify.stop_timer"
@@ -1428,27 +1921,7 @@ class CLOCKIFY_OT_StopTimer(bpy.types.Operator):
         set_operation_in_progress("stop", True)
         scene.clockify_status = "Stopping timer..."
         
-        def timer_stopped_callback(action, data):
-            try:
-                if action == 'timer_stopped':
-                    def main_thread_update():
-                        handle_timer_stopped(action, data)
-                        return None
-                    bpy.app.timers.register(main_thread_update, first_interval=0.01)
-                elif action == 'no_active_timer':
-                    def main_thread_no_timer():
-                        handle_no_active_timer()
-                        return None
-                    bpy.app.timers.register(main_thread_no_timer, first_interval=0.01)
-                elif action == 'error':
-                    def main_thread_error():
-                        scene.clockify_status = f"Error stopping timer: {data}"
-                        return None
-                    bpy.app.timers.register(main_thread_error, first_interval=0.01)
-            finally:
-                set_operation_in_progress("stop", False)
-        
-        stop_timer_async(timer_stopped_callback)
+        stop_timer_async(on_timer_stopped)
         return {'FINISHED'}
 
 class CLOCKIFY_OT_ResetTimerPrompt(bpy.types.Operator):
@@ -1492,18 +1965,7 @@ class CLOCKIFY_OT_ProjectStatus(bpy.types.Operator):
         
         set_operation_in_progress("status", True)
         scene.clockify_status = "Getting project status..."
-        
-        def status_callback(action, data):
-            try:
-                if action == 'error':
-                    def main_thread_error():
-                        scene.clockify_status = f"Error getting project status: {data}"
-                        return None
-                    bpy.app.timers.register(main_thread_error, first_interval=0.01)
-            finally:
-                set_operation_in_progress("status", False)
-        
-        get_project_summary_async(project, status_callback)
+        get_project_summary_async(project, on_project_status)
         return {'FINISHED'}
 
 class CLOCKIFY_OT_CheckTimer(bpy.types.Operator):
@@ -1514,13 +1976,8 @@ class CLOCKIFY_OT_CheckTimer(bpy.types.Operator):
         scene = context.scene
         scene.clockify_status = "Checking timer..."
         
-        def timer_checked_callback(action, data):
-            def main_thread_update():
-                handle_current_timer(action, data)
-                return None
-            bpy.app.timers.register(main_thread_update, first_interval=0.01)
-        
-        get_current_timer_async(timer_checked_callback)
+        # The 'current_timer' (or 'error') result is applied by its queue handler
+        get_current_timer_async()
         return {'FINISHED'}
 
 class CLOCKIFY_OT_CheckCredentials(bpy.types.Operator):
@@ -1537,14 +1994,8 @@ class CLOCKIFY_OT_CheckCredentials(bpy.types.Operator):
         
         context.scene.clockify_status = "Checking credentials..."
         
-        def credentials_checked_callback(action, data):
-            if action == 'error':
-                def main_thread_error():
-                    context.scene.clockify_status = f"Error: {data}"
-                    return None
-                bpy.app.timers.register(main_thread_error, first_interval=0.01)
-        
-        get_user_info_async(credentials_checked_callback)
+        # handle_user_info fills in the User ID; errors reach the status line via the queue
+        get_user_info_async()
         return {'FINISHED'}
 
 class CLOCKIFY_OT_RefreshClients(bpy.types.Operator):
@@ -1553,22 +2004,14 @@ class CLOCKIFY_OT_RefreshClients(bpy.types.Operator):
     bl_description = "Refresh the client list from Clockify"
 
     def execute(self, context):
+        if is_operation_in_progress("refresh_clients"):
+            self.report({'WARNING'}, "Clients are already refreshing, please wait...")
+            return {'CANCELLED'}
+        
         scene = context.scene
+        set_operation_in_progress("refresh_clients", True)
         scene.clockify_status = "Refreshing clients..."
-        
-        def clients_refreshed_callback(action, data):
-            if action == 'clients_fetched':
-                def main_thread_update():
-                    scene.clockify_status = "Clients refreshed successfully!"
-                    return None
-                bpy.app.timers.register(main_thread_update, first_interval=0.01)
-            elif action == 'error':
-                def main_thread_error():
-                    scene.clockify_status = f"Error refreshing clients: {data}"
-                    return None
-                bpy.app.timers.register(main_thread_error, first_interval=0.01)
-        
-        fetch_clients_async(clients_refreshed_callback)
+        fetch_clients_async(on_clients_refreshed)
         return {'FINISHED'}
 
 class CLOCKIFY_OT_RefreshProjects(bpy.types.Operator):
@@ -1577,25 +2020,88 @@ class CLOCKIFY_OT_RefreshProjects(bpy.types.Operator):
     bl_description = "Refresh the project list from Clockify"
 
     def execute(self, context):
+        if is_operation_in_progress("refresh_projects"):
+            self.report({'WARNING'}, "Projects are already refreshing, please wait...")
+            return {'CANCELLED'}
+        
         scene = context.scene
+        set_operation_in_progress("refresh_projects", True)
         scene.clockify_status = "Refreshing projects..."
-        
-        def projects_refreshed_callback(action, data):
-            if action == 'projects_fetched':
-                def main_thread_update():
-                    scene.clockify_status = "Projects refreshed successfully!"
-                    return None
-                bpy.app.timers.register(main_thread_update, first_interval=0.01)
-            elif action == 'error':
-                def main_thread_error():
-                    scene.clockify_status = f"Error refreshing projects: {data}"
-                    return None
-                bpy.app.timers.register(main_thread_error, first_interval=0.01)
-        
-        fetch_projects_async(projects_refreshed_callback)
+        fetch_projects_async(on_projects_refreshed)
         return {'FINISHED'}
 
 # --- PANEL ---
+_active_timer_info_cache = (None, ())  # (inputs key, (text, icon) rows)
+
+def get_active_timer_info_rows(scene, prefs):
+    """(text, icon) rows for the panel's active timer box, rebuilt only when their inputs change.
+    
+    prefs is the dict from get_preferences_cached().
+    """
+    global _active_timer_info_cache
+    show_task = prefs['show_task_name']
+    show_project = prefs['show_project_name']
+    show_client = prefs['show_client_name']
+    show_elapsed = prefs['show_elapsed_time']
+    show_billable = prefs['show_billable']
+    
+    # Elapsed and billable lines are rebuilt at most once per second
+    elapsed_str = billable_str = ""
+    if show_elapsed or show_billable:
+        elapsed_str, billable_str = refresh_timer_text()
+    
+    key = (
+        scene.clockify_active_timer_desc if show_task else None,
+        scene.clockify_active_project_name if show_project else None,
+        scene.clockify_active_client_name if show_client else None,
+        elapsed_str if show_elapsed else None,
+        billable_str if show_billable else None
+    )
+    if key == _active_timer_info_cache[0]:
+        return _active_timer_info_cache[1]
+    
+    desc, project_name, client_name, elapsed, billable = key
+    rows = []
+    
+    # Show task description if enabled
+    if desc is not None:
+        rows.append((f"Task: {desc}", 'NONE'))
+    
+    # Show project name if enabled
+    if project_name:
+        rows.append((f"Project: {project_name}", 'NONE'))
+    
+    # Show client name if enabled and available
+    if client_name:
+        rows.append((f"Client: {client_name}", 'NONE'))
+    
+    # Show elapsed time if enabled
+    if elapsed is not None:
+        rows.append((elapsed, 'NONE'))
+    
+    # Show billing info if enabled
+    if billable:
+        rows.append((billable, 'SOLO_ON'))
+    
+    rows = tuple(rows)
+    _active_timer_info_cache = (key, rows)
+    return rows
+
+@functools.lru_cache(maxsize=8)
+def _split_panel_lines(text):
+    """Cached split of a multi-line status/summary string, keyed by its value"""
+    return tuple(text.split('\n'))
+
+@functools.lru_cache(maxsize=8)
+def _split_summary_lines(text):
+    """Cached non-blank (line, is_billable_line) pairs of the project summary string"""
+    return tuple((line, 'Billable:' in line) for line in text.split('\n') if line.strip())
+
+@functools.lru_cache(maxsize=8)
+def _split_nonempty_panel_lines(text):
+    """Cached split of a summary string, dropping blank lines"""
+    return tuple(line for line in text.split('\n') if line.strip())
+
 class CLOCKIFY_PT_TrackerPanel(bpy.types.Panel):
     bl_label = "Clockify Tracker"
     bl_idname = "CLOCKIFY_PT_TrackerPanel"
@@ -1605,13 +2111,25 @@ class CLOCKIFY_PT_TrackerPanel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        global _initial_fetch_done
+        
+        # Load clients and projects the first time the panel is actually shown
+        if not _initial_fetch_done:
+            _initial_fetch_done = True
+            fetch_bootstrap_async()
+        
         scene = context.scene
-        prefs = get_preferences()
+        prefs = get_preferences_cached()
+        show_billable, show_last_session = prefs['show_billable'], prefs['show_last_session']
+        ops = snapshot_operations()
         
         # Client selection dropdown
         row = layout.row()
         row.prop(scene, "clockify_client", text="Client")
-        row.operator("clockify.refresh_clients", text="", icon='FILE_REFRESH')
+        refresh_col = row.column()
+        refresh_col.operator("clockify.refresh_clients", text="", icon='FILE_REFRESH')
+        if ops["refresh_clients"]:
+            refresh_col.enabled = False
         
         # New client name input
         if scene.clockify_show_new_client_field:
@@ -1624,7 +2142,10 @@ class CLOCKIFY_PT_TrackerPanel(bpy.types.Panel):
         # Project selection
         row = layout.row()
         row.prop(scene, "clockify_project", text="Project")
-        row.operator("clockify.refresh_projects", text="", icon='FILE_REFRESH')
+        refresh_col = row.column()
+        refresh_col.operator("clockify.refresh_projects", text="", icon='FILE_REFRESH')
+        if ops["refresh_projects"]:
+            refresh_col.enabled = False
         
         # New project name input
         if scene.clockify_show_new_project_field:
@@ -1634,77 +2155,50 @@ class CLOCKIFY_PT_TrackerPanel(bpy.types.Panel):
         row = layout.row(align=True)
         start_col = row.column()
         start_col.operator("clockify.start_timer", text="Start Timer", icon='PLAY')
-        if is_operation_in_progress("start"):
+        if ops["start"]:
             start_col.enabled = False
         
         stop_col = row.column()
         stop_col.operator("clockify.stop_timer", text="Stop Timer", icon='SNAP_FACE')
-        if is_operation_in_progress("stop"):
+        if ops["stop"]:
             stop_col.enabled = False
         
         # Project status button
         row = layout.row()
         status_col = row.column()
         status_col.operator("clockify.project_status", text="Project Status", icon='PRESET')
-        if is_operation_in_progress("status"):
+        if ops["status"]:
             status_col.enabled = False
 
         # Status display
-        if hasattr(scene, 'clockify_status') and scene.clockify_status:
+        if scene.clockify_status:
             box = layout.box()
-            for line in scene.clockify_status.split('\n'):
+            for line in _split_panel_lines(scene.clockify_status):
                 box.label(text=line, icon='INFO')
 
         # Project summary (month total) - show regardless of billable setting
-        if hasattr(scene, 'clockify_project_summary') and scene.clockify_project_summary:
+        if scene.clockify_project_summary:
             box = layout.box()
             box.label(text="📊 Project Summary:", icon='PRESET')
-            for line in scene.clockify_project_summary.split('\n'):
-                if line.strip():
-                    # Only filter out billable info if billable display is disabled
-                    if not prefs.show_billable and 'Billable:' in line:
-                        continue
-                    box.label(text=f"  {line}")
+            for line, is_billable_line in _split_summary_lines(scene.clockify_project_summary):
+                # Only filter out billable info if billable display is disabled
+                if is_billable_line and not show_billable:
+                    continue
+                box.label(text=f"  {line}")
 
         # Active timer info
         if scene.clockify_active_timer_id:
             box = layout.box()
             box.label(text="⏱ Active Timer:", icon='TIME')
-            
-            # Show task description if enabled
-            if prefs.show_task_name:
-                box.label(text=f"Task: {scene.clockify_active_timer_desc}")
-            
-            # Show project name if enabled    
-            if prefs.show_project_name and scene.clockify_active_project_name:
-                box.label(text=f"Project: {scene.clockify_active_project_name}")
-            
-            # Show client name if enabled and available
-            if prefs.show_client_name and hasattr(scene, 'clockify_active_client_name') and scene.clockify_active_client_name:
-                box.label(text=f"Client: {scene.clockify_active_client_name}")
-            
-            # Show elapsed time if enabled
-            if prefs.show_elapsed_time:
-                current_duration = get_current_timer_duration()
-                time_display = format_duration_detailed(current_duration)
-                box.label(text=f"Elapsed: {time_display}")
-            
-            # Show billing info if enabled
-            if prefs.show_billable:
-                current_duration = get_current_timer_duration()
-                billing = calculate_billing_info(current_duration)
-                if billing['hours'] > 0:
-                    box.label(text=f"Billable: ${billing['billable_amount']:.2f} @ ${prefs.hourly_rate}/hr", icon='SOLO_ON')
+            for text, icon in get_active_timer_info_rows(scene, prefs):
+                box.label(text=text, icon=icon)
         
         # Last session summary - only show if enabled and has content
-        if (prefs.show_last_session and 
-            hasattr(scene, 'clockify_last_session_summary') and 
-            scene.clockify_last_session_summary):
+        if show_last_session and scene.clockify_last_session_summary:
             box = layout.box()
             box.label(text="📊 Last Session:", icon='CHECKMARK')
-            for line in scene.clockify_last_session_summary.split('\n'):
-                if line.strip():
-                    box.label(text=f"  {line}")
+            for line in _split_nonempty_panel_lines(scene.clockify_last_session_summary):
+                box.label(text=f"  {line}")
 
 # --- REGISTER ---
 classes = (
@@ -1719,9 +2213,12 @@ classes = (
     CLOCKIFY_PT_TrackerPanel,
 )
 
+# Registers in order and unregisters in reverse
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    global _scene_properties_registered
+    _register_classes()
 
     # Client selection dropdown
     bpy.types.Scene.clockify_client = EnumProperty(
@@ -1785,6 +2282,8 @@ def register():
     bpy.types.Scene.clockify_active_project_name = StringProperty()
     bpy.types.Scene.clockify_active_client_name = StringProperty()
     
+    _scene_properties_registered = True
+    
     # Add the timer display to the top bar
     bpy.types.TOPBAR_HT_upper_bar.append(draw_clockify_timer)
     
@@ -1795,41 +2294,26 @@ def register():
     # Start the background task processor
     bpy.app.timers.register(process_api_queue, persistent=True)
     
-    # Initialize clients and projects on startup
-    fetch_clients_async()
-    fetch_projects_async()
+    # Create the shared API worker pool up front, ahead of the startup request;
+    # unregister() shuts it down again
+    get_api_executor()
+    
+    # Clients and projects load on the first panel draw; a timer left running
+    # still needs restoring right away, which handle_current_timer applies
+    if get_api_config()['user_id']:
+        get_current_timer_async()
     
     # Load task description if file already has one
     load_task_description_from_file()
-    
-    # Check for existing timer on startup
-    def startup_check_callback(action, data):
-        if action == 'current_timer' and data:
-            start_time_str = data['timeInterval']['start']
-            try:
-                start_time_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                set_timer_start_time(start_time_dt.timestamp())
-                
-                if not bpy.app.timers.is_registered(update_timer_display):
-                    bpy.app.timers.register(update_timer_display, first_interval=1.0)
-            except Exception as e:
-                print(f"Error parsing startup timer: {e}")
-                set_timer_start_time(time.time())
-    
-    def delayed_timer_check():
-        get_current_timer_async(startup_check_callback)
-        return None
-    
-    bpy.app.timers.register(delayed_timer_check, first_interval=2.0)
 
 def unregister():
+    global _scene_properties_registered, _initial_fetch_done
     # Stop all operations in progress
     with _operation_lock:
         for key in _operation_in_progress:
             _operation_in_progress[key] = False
     
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
 
     # Remove the timer display from the top bar
     try:
@@ -1845,13 +2329,30 @@ def unregister():
         pass  # Handler wasn't registered
     
     # Unregister all timers
-    timers_to_unregister = [process_api_queue, update_timer_display]
-    for timer_func in timers_to_unregister:
-        if bpy.app.timers.is_registered(timer_func):
-            bpy.app.timers.unregister(timer_func)
+    if bpy.app.timers.is_registered(process_api_queue):
+        bpy.app.timers.unregister(process_api_queue)
+    _stop_display_ticker()
+
+    # Release pooled connections and workers
+    shutdown_api_executor()
+    invalidate_preferences_cache()
+    close_http_session()
+    with _inflight_lock:
+        _inflight_requests.clear()
+    _initial_fetch_done = False
+    
+    # Drop deferred main-thread calls and queued API results that referenced
+    # the old scene properties, so the next register() doesn't process them
+    for pending_queue in (_main_thread_queue, api_queue):
+        while True:
+            try:
+                pending_queue.get_nowait()
+            except Empty:
+                break
 
     # Clean up scene properties
-    properties_to_remove = [
+    _scene_properties_registered = False
+    properties_to_remove = (
         'clockify_client',
         'clockify_new_client_name',
         'clockify_show_new_client_field',
@@ -1867,13 +2368,11 @@ def unregister():
         'clockify_active_project',
         'clockify_active_project_name',
         'clockify_active_client_name'
-    ]
+    )
     
     for prop in properties_to_remove:
-        try:
+        if hasattr(bpy.types.Scene, prop):
             delattr(bpy.types.Scene, prop)
-        except AttributeError:
-            pass
 
 if __name__ == "__main__":
     register()
\ No newline at end of file